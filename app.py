@@ -1,6 +1,10 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from plotly_resampler import FigureResampler
+from tsdownsample import NaNMinMaxLTTBDownsampler
 from datetime import datetime, timedelta
 
 # Import custom modules
@@ -10,23 +14,186 @@ from strategies.rsi import apply_rsi_strategy
 from backtesting.engine import run_backtest
 from risk.risk_manager import apply_risk_caps
 
+# Columns shown in the trade data preview unless all columns are requested
+PREVIEW_COLUMNS = ['Close', 'Signal', 'Position', 'Strategy_Return', 'Cumulative_Strategy_Return']
+
 # Logo Configuration
 LOGO_PATH = "assets/arad_logo.png"
 
-# Page Configuration
-try:
-    st.set_page_config(
-        page_title="A_RAD | Algorithmic Trading Strategy Simulator",
-        layout="wide",
-        page_icon=LOGO_PATH
+# Upper bound on points per chart trace; longer series are downsampled (MinMaxLTTB)
+MAX_CHART_POINTS = 2000
+
+
+def resampled_figure(figure):
+    """Wraps a Plotly figure so long line traces are downsampled before rendering."""
+    return FigureResampler(
+        figure,
+        default_n_shown_samples=MAX_CHART_POINTS,
+        show_mean_aggregation_size=False,
+        resampled_trace_prefix_suffix=("", "")
+    )
+
+
+def candle_rows(close):
+    """Picks which candles to draw, using MinMaxLTTB on the close so peaks survive."""
+    if len(close) <= MAX_CHART_POINTS:
+        return slice(None)
+    return NaNMinMaxLTTBDownsampler().downsample(close, n_out=MAX_CHART_POINTS)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _build_price_fig(data_key, _data, ticker, strategy_choice,
+                     short_window=None, long_window=None,
+                     rsi_oversold=None, rsi_overbought=None):
+    """
+    Builds the price chart with strategy overlays and buy/sell markers.
+
+    The figure is cached by `data_key` (a hash of the frame) and the chart
+    parameters; `_data` itself is not hashed by Streamlit.
+    """
+    data = _data
+
+    # Candles share one downsampled index so OHLC rows stay aligned
+    candles = data.iloc[candle_rows(data['Close'].to_numpy())]
+    candlestick = go.Candlestick(
+        x=candles.index,
+        open=candles['Open'],
+        high=candles['High'],
+        low=candles['Low'],
+        close=candles['Close'],
+        name='OHLC'
     )
-except Exception:
-    st.set_page_config(
-        page_title="A_RAD | Algorithmic Trading Strategy Simulator",
-        layout="wide",
-        page_icon="📈"
+
+    # ── Buy / Sell signal markers ──────────────────────────────────────
+    # Only the dates and closes are needed, so mask the raw arrays
+    position = data['Position'].to_numpy()
+    close = data['Close'].to_numpy()
+    buy_mask  = position ==  1
+    sell_mask = position == -1
+    markers = [
+        go.Scatter(
+            x=data.index[buy_mask],
+            y=close[buy_mask],
+            mode='markers',
+            marker=dict(symbol='triangle-up', size=15, color='#00FF00'),
+            name='Buy Signal'
+        ),
+        go.Scatter(
+            x=data.index[sell_mask],
+            y=close[sell_mask],
+            mode='markers',
+            marker=dict(symbol='triangle-down', size=15, color='#FF0000'),
+            name='Sell Signal'
+        )
+    ]
+
+    layout = dict(
+        template="plotly_dark",
+        height=650,
+        title_text=f"{ticker} — {strategy_choice}",
+        xaxis_rangeslider_visible=False
     )
 
+    # Traces are passed in one batch so the figure is validated once, and the
+    # finished figure is wrapped once so long line traces get downsampled.
+    # ── Strategy-specific overlays ─────────────────────────────────────
+    if strategy_choice == "SMA Crossover":
+        traces = [
+            candlestick,
+            go.Scatter(
+                x=data.index,
+                y=data['Short_SMA'],
+                mode='lines',
+                name=f'Short SMA ({short_window})',
+                line=dict(color='orange')
+            ),
+            go.Scatter(
+                x=data.index,
+                y=data['Long_SMA'],
+                mode='lines',
+                name=f'Long SMA ({long_window})',
+                line=dict(color='blue')
+            ),
+            *markers
+        ]
+        return resampled_figure(go.Figure(data=traces, layout=layout))
+
+    # RSI is plotted in a separate sub-panel below the candlestick
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        row_heights=[0.7, 0.3],
+        vertical_spacing=0.05,
+        subplot_titles=(f"{ticker} Price", "RSI (14)")
+    )
+
+    # Candlestick and markers — row 1, RSI line — row 2
+    rsi_line = go.Scatter(
+        x=data.index,
+        y=data['RSI'],
+        mode='lines',
+        name='RSI',
+        line=dict(color='#FF2E88', width=1.5)
+    )
+    fig.add_traces(
+        [candlestick, rsi_line, *markers],
+        rows=[1, 2, 1, 1],
+        cols=[1, 1, 1, 1]
+    )
+
+    # Oversold / overbought reference lines
+    for level, color, label in [
+        (rsi_oversold,  '#00FF00', f'Oversold ({rsi_oversold})'),
+        (rsi_overbought, '#FF4444', f'Overbought ({rsi_overbought})')
+    ]:
+        fig.add_hline(
+            y=level,
+            line_dash='dash',
+            line_color=color,
+            annotation_text=label,
+            annotation_position='bottom right',
+            row=2, col=1
+        )
+
+    fig.update_layout(**layout)
+    return resampled_figure(fig)
+
+# Page Configuration
+def _configure_page():
+    """Sets the page title/layout, falling back to an emoji icon if the logo is missing."""
+    # Not cached: st.cache_resource is shared across sessions, and every session
+    # (and rerun) has to send its own page config.
+    try:
+        st.set_page_config(
+            page_title="A_RAD | Algorithmic Trading Strategy Simulator",
+            layout="wide",
+            page_icon=LOGO_PATH
+        )
+    except Exception:
+        st.set_page_config(
+            page_title="A_RAD | Algorithmic Trading Strategy Simulator",
+            layout="wide",
+            page_icon="📈"
+        )
+
+
+_configure_page()
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_up_kernels():
+    """
+    Runs both strategies and the backtest once on a tiny frame so the Numba
+    kernels are compiled (or loaded from Numba's disk cache) at startup,
+    not on the first "Run Strategy" click.
+    """
+    sample = pd.DataFrame({'Close': np.linspace(100.0, 110.0, 30)})
+    run_backtest(apply_moving_average_strategy(sample.copy(), 5, 10))
+    run_backtest(apply_rsi_strategy(sample.copy(), 14, 30, 70))
+
+
+_warm_up_kernels()
+
 # ---------- HEADER ----------
 c1, c2, c3 = st.columns([1, 6, 1])
 
@@ -85,13 +252,22 @@ risk_cap = st.sidebar.slider(
     help="Daily stop-loss: limit max loss per day."
 ) / 100.0
 
+# ── Trade data preview ─────────────────────────────────────────────────────────
+show_all_columns = st.sidebar.checkbox(
+    "Show all trade data columns",
+    False,
+    help="Include every indicator and return column in the trade data preview."
+)
+
 run_button = st.sidebar.button("Run Strategy 🚀")
 
 # ---------- STRATEGY EXECUTION ----------
 if run_button:
     with st.spinner("Executing Strategy..."):
         # 1. Fetch Data
-        data = fetch_data(ticker, start_date, end_date)
+        # st.cache_data hands back a fresh copy, so the pipeline below can add
+        # columns to this frame in place without touching the cached download.
+        data = fetch_data(ticker, str(start_date), str(end_date))
 
         if data.empty:
             st.error("Invalid ticker or date range / No data found.")
@@ -109,14 +285,9 @@ if run_button:
         # 4. Risk Management
         data = apply_risk_caps(data, max_loss_per_trade=risk_cap)
 
-        # Re-calculate cumulative returns after risk adjustment
-        if 'Strategy_Return' in data.columns:
-            data['Cumulative_Strategy_Return'] = (1 + data['Strategy_Return']).cumprod()
-            data['Cumulative_Market_Return']   = (1 + data['Market_Return']).cumprod()
-
         # ---------- METRICS ----------
-        strategy_total_return = data['Cumulative_Strategy_Return'].iloc[-1] - 1
-        market_total_return   = data['Cumulative_Market_Return'].iloc[-1] - 1
+        strategy_total_return = data['Cumulative_Strategy_Return'].to_numpy()[-1] - 1
+        market_total_return   = data['Cumulative_Market_Return'].to_numpy()[-1] - 1
         alpha = strategy_total_return - market_total_return
 
         col1, col2, col3 = st.columns(3)
@@ -127,161 +298,55 @@ if run_button:
         # ---------- MAIN CHART ----------
         st.subheader("Market Chart")
 
-        fig = go.Figure(data=[go.Candlestick(
-            x=data.index,
-            open=data['Open'],
-            high=data['High'],
-            low=data['Low'],
-            close=data['Close'],
-            name='OHLC'
-        )])
-
-        # ── Strategy-specific overlays ─────────────────────────────────────────
-        if strategy_choice == "SMA Crossover":
-            fig.add_scatter(
-                x=data.index,
-                y=data['Short_SMA'],
-                mode='lines',
-                name=f'Short SMA ({short_window})',
-                line=dict(color='orange')
-            )
-            fig.add_scatter(
-                x=data.index,
-                y=data['Long_SMA'],
-                mode='lines',
-                name=f'Long SMA ({long_window})',
-                line=dict(color='blue')
-            )
-        else:
-            # RSI is plotted in a separate sub-panel below the candlestick
-            fig = go.Figure()  # rebuild as multi-row figure
-
-            from plotly.subplots import make_subplots
-            fig = make_subplots(
-                rows=2, cols=1,
-                shared_xaxes=True,
-                row_heights=[0.7, 0.3],
-                vertical_spacing=0.05,
-                subplot_titles=(f"{ticker} Price", "RSI (14)")
-            )
-
-            # Candlestick — row 1
-            fig.add_trace(go.Candlestick(
-                x=data.index,
-                open=data['Open'],
-                high=data['High'],
-                low=data['Low'],
-                close=data['Close'],
-                name='OHLC'
-            ), row=1, col=1)
-
-            # RSI line — row 2
-            fig.add_trace(go.Scatter(
-                x=data.index,
-                y=data['RSI'],
-                mode='lines',
-                name='RSI',
-                line=dict(color='#FF2E88', width=1.5)
-            ), row=2, col=1)
-
-            # Oversold / overbought reference lines
-            for level, color, label in [
-                (rsi_oversold,  '#00FF00', f'Oversold ({rsi_oversold})'),
-                (rsi_overbought, '#FF4444', f'Overbought ({rsi_overbought})')
-            ]:
-                fig.add_hline(
-                    y=level,
-                    line_dash='dash',
-                    line_color=color,
-                    annotation_text=label,
-                    annotation_position='bottom right',
-                    row=2, col=1
-                )
-
-        # ── Buy / Sell signal markers ──────────────────────────────────────────
-        buy_signals  = data[data['Position'] ==  1.0]
-        sell_signals = data[data['Position'] == -1.0]
-
-        if buy_signals.empty and sell_signals.empty:
+        position = data['Position'].to_numpy()
+        if not (position == 1).any() and not (position == -1).any():
             st.warning("No buy/sell signals in this period. Try adjusting parameters or date range.")
 
-        marker_row = 1 if strategy_choice == "RSI Strategy" else None
-
-        common_kw = dict(row=marker_row, col=(1 if marker_row else None)) if strategy_choice == "RSI Strategy" else {}
-
+        data_key = int(pd.util.hash_pandas_object(data).sum())
         if strategy_choice == "SMA Crossover":
-            fig.add_scatter(
-                x=buy_signals.index,
-                y=buy_signals['Close'],
-                mode='markers',
-                marker=dict(symbol='triangle-up', size=15, color='#00FF00'),
-                name='Buy Signal'
-            )
-            fig.add_scatter(
-                x=sell_signals.index,
-                y=sell_signals['Close'],
-                mode='markers',
-                marker=dict(symbol='triangle-down', size=15, color='#FF0000'),
-                name='Sell Signal'
-            )
+            fig = _build_price_fig(data_key, data, ticker, strategy_choice,
+                                   short_window=short_window, long_window=long_window)
         else:
-            fig.add_trace(go.Scatter(
-                x=buy_signals.index,
-                y=buy_signals['Close'],
-                mode='markers',
-                marker=dict(symbol='triangle-up', size=15, color='#00FF00'),
-                name='Buy Signal'
-            ), row=1, col=1)
-            fig.add_trace(go.Scatter(
-                x=sell_signals.index,
-                y=sell_signals['Close'],
-                mode='markers',
-                marker=dict(symbol='triangle-down', size=15, color='#FF0000'),
-                name='Sell Signal'
-            ), row=1, col=1)
-
-        fig.update_layout(
-            template="plotly_dark",
-            height=650,
-            title_text=f"{ticker} — {strategy_choice}",
-            xaxis_rangeslider_visible=False
-        )
+            fig = _build_price_fig(data_key, data, ticker, strategy_choice,
+                                   rsi_oversold=rsi_oversold, rsi_overbought=rsi_overbought)
 
         st.plotly_chart(fig, use_container_width=True)
 
         # ---------- PERFORMANCE CHART ----------
         st.subheader("Strategy vs Market Performance")
 
-        perf = go.Figure()
-
-        perf.add_scatter(
-            x=data.index,
-            y=data['Cumulative_Market_Return'],
-            mode='lines',
-            name='Market (Buy & Hold)',
-            line=dict(color='gray', dash='dash')
-        )
-
-        perf.add_scatter(
-            x=data.index,
-            y=data['Cumulative_Strategy_Return'],
-            mode='lines',
-            name='Strategy (A_RAD)',
-            line=dict(color='#FF2E88', width=2)
-        )
-
-        perf.update_layout(
-            template="plotly_dark",
-            height=500,
-            title_text="Cumulative Returns Comparison",
-            yaxis_tickformat='.0%'
-        )
+        perf = resampled_figure(go.Figure(
+            data=[
+                go.Scatter(
+                    x=data.index,
+                    y=data['Cumulative_Market_Return'],
+                    mode='lines',
+                    name='Market (Buy & Hold)',
+                    line=dict(color='gray', dash='dash')
+                ),
+                go.Scatter(
+                    x=data.index,
+                    y=data['Cumulative_Strategy_Return'],
+                    mode='lines',
+                    name='Strategy (A_RAD)',
+                    line=dict(color='#FF2E88', width=2)
+                )
+            ],
+            layout=dict(
+                template="plotly_dark",
+                height=500,
+                title_text="Cumulative Returns Comparison",
+                yaxis_tickformat='.0%'
+            )
+        ))
 
         st.plotly_chart(perf, use_container_width=True)
 
         # ---------- DATA PREVIEW ----------
         with st.expander("View Trade Data"):
-            st.dataframe(data.tail(10))
+            # Only the requested columns are serialized and sent to the browser
+            preview = data if show_all_columns else data[PREVIEW_COLUMNS]
+            st.dataframe(preview.tail(10))
 
         # Risk Analysis
         if 'Risk_Breach' in data.columns and data['Risk_Breach'].any():
@@ -0,0 +1,43 @@
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True)
+def _backtest_returns(close, signal):
+    """
+    Computes market/strategy returns and their cumulative products in one pass.
+
+    Equivalent to `pct_change()`, `Market_Return * Signal.shift(1)` and the
+    two `(1 + r).cumprod()` calls, where NaN returns stay NaN and are skipped
+    by the running products.
+
+    Args:
+        close  (np.ndarray): float64 array of close prices.
+        signal (np.ndarray): float64 array of signals (1 = long, 0 = flat).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Market return,
+            strategy return, cumulative market return, cumulative strategy return.
+    """
+    size = close.shape[0]
+    market = np.full(size, np.nan)
+    strategy = np.full(size, np.nan)
+    cum_market = np.full(size, np.nan)
+    cum_strategy = np.full(size, np.nan)
+
+    market_growth = 1.0
+    strategy_growth = 1.0
+    for i in range(1, size):
+        mret = close[i] / close[i - 1] - 1.0
+        sret = mret * signal[i - 1]
+        market[i] = mret
+        strategy[i] = sret
+        if mret == mret:
+            market_growth *= 1.0 + mret
+            cum_market[i] = market_growth
+        if sret == sret:
+            strategy_growth *= 1.0 + sret
+            cum_strategy[i] = strategy_growth
+
+    return market, strategy, cum_market, cum_strategy
@@ -1,11 +1,14 @@
 import pandas as pd
+import numpy as np
+
+from backtesting._backtest_njit import _backtest_returns
 
 def run_backtest(data):
     """
     Runs a backtest on the provided data which includes signals.
     
     Args:
-        data (pd.DataFrame): DataFrame with 'Close', 'Signal'.
+        data (pd.DataFrame): DataFrame with 'Close', 'Signal'. Modified in place.
         
     Returns:
         pd.DataFrame: Data with 'Market_Return', 'Strategy_Return', 'Cumulative_Market_Return', 'Cumulative_Strategy_Return'.
@@ -13,17 +16,19 @@ def run_backtest(data):
     if data.empty or 'Signal' not in data.columns:
         return data
         
-    df = data.copy()
-    
-    # Calculate daily market returns
-    df['Market_Return'] = df['Close'].pct_change()
+    # Columns are written in place; the caller owns the frame
+    df = data
     
-    # Calculate strategy returns
-    # Shift signal by 1 because we trade based on yesterday's signal (close price)
-    df['Strategy_Return'] = df['Market_Return'] * df['Signal'].shift(1)
-    
-    # Calculate cumulative returns
-    df['Cumulative_Market_Return'] = (1 + df['Market_Return']).cumprod()
-    df['Cumulative_Strategy_Return'] = (1 + df['Strategy_Return']).cumprod()
+    # Market returns, strategy returns and both cumulative products in one pass.
+    # The strategy trades on yesterday's signal (close price).
+    close = df['Close'].to_numpy(dtype=np.float64)
+    # int8 signals are widened once so the kernel sees a single float64 signature
+    signal = df['Signal'].to_numpy(dtype=np.float64)
+    market, strategy, cum_market, cum_strategy = _backtest_returns(close, signal)
+
+    df['Market_Return'] = market
+    df['Strategy_Return'] = strategy
+    df['Cumulative_Market_Return'] = cum_market
+    df['Cumulative_Strategy_Return'] = cum_strategy
     
     return df
@@ -1,26 +1,78 @@
+import time
+from pathlib import Path
+
+import streamlit as st
 import yfinance as yf
 import pandas as pd
 
+# On-disk cache of daily bars, shared across sessions and server restarts
+CACHE_DIR = Path(".cache")
+CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
 def fetch_data(ticker, start_date, end_date):
     """
     Fetches historical OHLC data for a given ticker using yfinance.
+
+    Successful downloads are cached in memory for an hour and persisted as
+    parquet under `CACHE_DIR` for up to `CACHE_MAX_AGE` seconds. Failures are
+    never cached, so a retry goes back to Yahoo.
     
     Args:
-        ticker (str): Stock ticker symbol.
-        start_date (str/datetime): Start date for data.
-        end_date (str/datetime): End date for data.
+        ticker (str): Stock ticker symbol (case-insensitive; '/' is read as '-').
+        start_date (str): Start date for data (ISO format, used as cache key).
+        end_date (str): End date for data (ISO format, used as cache key).
         
     Returns:
         pd.DataFrame: DataFrame containing OHLC data or empty DataFrame on failure.
     """
+    # Normalize to Yahoo's form (BRK/B -> BRK-B). The symbol also names the
+    # cache file, so refuse anything that could point outside CACHE_DIR;
+    # other characters (e.g. the '&' in M&M.NS) are left for Yahoo to judge.
+    ticker = ticker.strip().upper().replace("/", "-")
+    cache_path = CACHE_DIR / f"{ticker}_{start_date}_{end_date}.parquet"
+    if (not ticker or ticker.startswith(".") or ".." in ticker or "\\" in ticker
+            or cache_path.resolve().parent != CACHE_DIR.resolve()):
+        print(f"Invalid ticker symbol: {ticker!r}")
+        return pd.DataFrame()
+
     try:
-        data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-        if data.empty:
-            return pd.DataFrame()
-        # Ensure we have a proper index and columns
-        if isinstance(data.columns, pd.MultiIndex):
-            data.columns = data.columns.get_level_values(0)
-        return data
+        return _fetch_history(ticker, start_date, end_date)
     except Exception as e:
         print(f"Error fetching data for {ticker}: {e}")
         return pd.DataFrame()
+
+
+# Downloads are the slowest step of a run; keep them for an hour so reruns
+# with the same ticker and dates skip the network entirely. Errors (including
+# empty responses) are raised rather than returned, because st.cache_data
+# does not store exceptions.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_history(ticker, start_date, end_date):
+    """Loads daily bars from the parquet cache or Yahoo; raises if none are available."""
+    cache_path = CACHE_DIR / f"{ticker}_{start_date}_{end_date}.parquet"
+    try:
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_MAX_AGE:
+            return pd.read_parquet(cache_path)
+    except Exception as e:
+        print(f"Ignoring unreadable cache for {ticker}: {e}")
+
+    # Single-symbol history() skips download()'s multi-ticker machinery.
+    # auto_adjust/actions match download()'s defaults (adjusted OHLC only).
+    data = yf.Ticker(ticker).history(
+        start=start_date,
+        end=end_date,
+        interval="1d",
+        auto_adjust=True,
+        actions=False
+    )
+    if data.empty:
+        raise ValueError("no data returned")
+    # history() returns exchange-local timestamps; keep plain dates like download()
+    data.index = data.index.tz_localize(None)
+
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        data.to_parquet(cache_path)
+    except Exception as e:
+        print(f"Could not cache data for {ticker}: {e}")
+    return data
@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 
 def apply_risk_caps(data, max_loss_per_trade=0.02):
     """
@@ -6,16 +7,18 @@ def apply_risk_caps(data, max_loss_per_trade=0.02):
     For MVP, we simulate a check: if a daily drop exceeds max_loss_per_trade, we exit.
     
     Args:
-        data (pd.DataFrame): DataFrame with 'Close' and 'Position'.
+        data (pd.DataFrame): DataFrame with 'Close' and 'Position'. Modified in place.
         max_loss_per_trade (float): Maximum allowed loss percentage per trade (default 2%).
         
     Returns:
-        pd.DataFrame: Data with adjusted positions based on risk caps.
+        pd.DataFrame: Data with capped 'Strategy_Return', 'Risk_Breach' and, if any
+        cap was hit, a recomputed 'Cumulative_Strategy_Return'.
     """
     if data.empty or 'Position' not in data.columns:
         return data
 
-    df = data.copy()
+    # Columns are written in place; the caller owns the frame
+    df = data
     # Simple risk management logic: calculates daily returns
     # If a daily return is < -max_loss_per_trade, force close position (Position=0)
     
@@ -24,8 +27,16 @@ def apply_risk_caps(data, max_loss_per_trade=0.02):
     if 'Strategy_Return' in df.columns:
         # Clamp losses: if Strategy_Return < -max_loss_per_trade, set it to -max_loss_per_trade
         # This simulates a stop-loss execution at that loss level
-        mask = df['Strategy_Return'] < -max_loss_per_trade
-        df.loc[mask, 'Strategy_Return'] = -max_loss_per_trade
+        # np.maximum clamps branchlessly and leaves NaN returns untouched
+        returns = df['Strategy_Return'].to_numpy()
+        capped = np.maximum(returns, -max_loss_per_trade)
+        # A breach is wherever the clamp raised the return (False for NaN)
+        mask = capped > returns
+        df['Strategy_Return'] = capped
         df['Risk_Breach'] = mask
+
+        # Capped returns change the equity curve; untouched runs keep the backtest's
+        if mask.any():
+            df['Cumulative_Strategy_Return'] = (1 + df['Strategy_Return']).cumprod()
         
     return df
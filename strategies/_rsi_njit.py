@@ -0,0 +1,87 @@
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True)
+def _wilder_rsi(close, n):
+    """
+    Computes Wilder's RSI in a single pass over the close prices.
+
+    Fuses the price diff, the gain/loss split and both smoothed averages
+    into one loop. The averages follow pandas'
+    `ewm(com=n - 1, min_periods=n).mean()` exactly, so the output matches the
+    previous pandas implementation.
+
+    Args:
+        close (np.ndarray): float64 array of close prices.
+        n     (int): RSI lookback period.
+
+    Returns:
+        np.ndarray: RSI values, NaN until `n` price changes have been seen
+            and wherever the average loss is zero.
+    """
+    size = close.shape[0]
+    rsi = np.full(size, np.nan)
+
+    decay = 1.0 - 1.0 / n
+    avg_gain = np.nan
+    avg_loss = np.nan
+    weight = 1.0
+    nobs = 0
+
+    for i in range(1, size):
+        delta = close[i] - close[i - 1]
+        if delta == delta:
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+            nobs += 1
+            if avg_gain == avg_gain:
+                weight *= decay
+                if avg_gain != gain:
+                    avg_gain = (weight * avg_gain + gain) / (weight + 1.0)
+                if avg_loss != loss:
+                    avg_loss = (weight * avg_loss + loss) / (weight + 1.0)
+                weight += 1.0
+            else:
+                avg_gain = gain
+                avg_loss = loss
+        elif avg_gain == avg_gain:
+            # Missing prices still decay the weight of older observations
+            weight *= decay
+
+        if nobs >= n and avg_loss != 0.0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return rsi
+
+
+@njit(cache=True)
+def _rsi_regime(rsi, oversold, overbought):
+    """
+    Carries the RSI long/flat regime forward in a single scan.
+
+    Enters long when RSI drops below `oversold` and exits when it rises above
+    `overbought`. Rows with a NaN RSI are flat but do not reset the regime.
+
+    Args:
+        rsi        (np.ndarray): float64 array of RSI values.
+        oversold   (float): Buy threshold.
+        overbought (float): Sell threshold.
+
+    Returns:
+        np.ndarray: int8 signal, 1 = hold long, 0 = flat.
+    """
+    out = np.zeros(rsi.shape[0], dtype=np.int8)
+    in_trade = False
+    for i in range(rsi.shape[0]):
+        r = rsi[i]
+        if np.isnan(r):
+            continue
+        if not in_trade and r < oversold:
+            in_trade = True
+        elif in_trade and r > overbought:
+            in_trade = False
+        if in_trade:
+            out[i] = 1
+    return out
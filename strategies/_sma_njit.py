@@ -0,0 +1,72 @@
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True)
+def _sma(x, w):
+    """
+    Computes a simple moving average with an O(N) running sum.
+
+    Mirrors pandas' `rolling(window=w).mean()` update rule: the running sum is
+    Kahan-compensated, a window of identical values returns that value exactly
+    (so flat stretches produce exact SMA ties), and the first `w - 1` values,
+    and any window containing a NaN, are NaN.
+
+    Args:
+        x (np.ndarray): float64 array of prices.
+        w (int): Window length.
+
+    Returns:
+        np.ndarray: Moving average of `x`.
+    """
+    size = x.shape[0]
+    out = np.full(size, np.nan)
+    total = 0.0
+    compensation_add = 0.0
+    compensation_remove = 0.0
+    valid = 0
+    negative = 0
+    same_run = 0
+    prev_value = np.nan
+
+    for i in range(size):
+        # Drop the value leaving the window before adding the new one
+        if i >= w:
+            old = x[i - w]
+            if old == old:
+                valid -= 1
+                y = -old - compensation_remove
+                t = total + y
+                compensation_remove = t - total - y
+                total = t
+                if old < 0.0:
+                    negative -= 1
+
+        value = x[i]
+        if value == value:
+            valid += 1
+            y = value - compensation_add
+            t = total + y
+            compensation_add = t - total - y
+            total = t
+            if value < 0.0:
+                negative += 1
+            if value == prev_value:
+                same_run += 1
+            else:
+                same_run = 1
+            prev_value = value
+
+        if valid == w:
+            if same_run >= valid:
+                out[i] = prev_value
+            else:
+                mean = total / valid
+                if negative == 0 and mean < 0.0:
+                    mean = 0.0
+                elif negative == valid and mean > 0.0:
+                    mean = 0.0
+                out[i] = mean
+
+    return out
@@ -1,12 +1,13 @@
-import pandas as pd
 import numpy as np
 
+from strategies._sma_njit import _sma
+
 def apply_moving_average_strategy(data, short_window, long_window):
     """
     Applies a simple moving average crossover strategy.
     
     Args:
-        data (pd.DataFrame): DataFrame containing 'Close' prices.
+        data (pd.DataFrame): DataFrame containing 'Close' prices. Modified in place.
         short_window (int): Window for short SMA.
         long_window (int): Window for long SMA.
         
@@ -16,26 +17,28 @@ def apply_moving_average_strategy(data, short_window, long_window):
     if data.empty:
         return data
     
-    df = data.copy()
+    # Columns are written in place; the caller owns the frame
+    df = data
     
     # Calculate Short and Long SMAs
-    df['Short_SMA'] = df['Close'].rolling(window=short_window).mean()
-    df['Long_SMA'] = df['Close'].rolling(window=long_window).mean()
+    close = df['Close'].to_numpy(dtype=np.float64)
+    df['Short_SMA'] = _sma(close, short_window)
+    df['Long_SMA'] = _sma(close, long_window)
     
     # Generate Signals
-    # 0.0 means no signal, 1.0 means buy
-    df['Signal'] = 0.0
-    
-    # Create a signal when the short moving average crosses the long moving average
-    # Use iloc to avoid SettingWithCopy warnings if slicing, though here we use the full df
-    # Start from the point where long_window is populated
-    df.iloc[short_window:, df.columns.get_loc('Signal')] = np.where(
-        df['Short_SMA'][short_window:] > df['Long_SMA'][short_window:], 1.0, 0.0
-    )
+    # 0 means no signal, 1 means buy (int8 keeps the column 8x smaller than float64)
+    # Create a signal when the short moving average crosses the long moving average,
+    # working on the raw arrays to skip pandas index alignment.
+    # Start from the point where short_window is populated
+    short_sma = df['Short_SMA'].to_numpy()
+    long_sma = df['Long_SMA'].to_numpy()
+    signal = (short_sma > long_sma).astype(np.int8)
+    signal[:short_window] = 0
+    df['Signal'] = signal
     
     # Generate Trading Orders (Positions)
     # Position = 1 (Long) or 0 (Neutral)
-    # Diff of Signal gives us the crossovers: 1.0 (Buy), -1.0 (Sell)
-    df['Position'] = df['Signal'].diff()
+    # Diff of Signal gives us the crossovers: 1 (Buy), -1 (Sell)
+    df['Position'] = np.diff(signal, prepend=np.int8(0))
     
     return df
@@ -1,6 +1,7 @@
-import pandas as pd
 import numpy as np
 
+from strategies._rsi_njit import _rsi_regime, _wilder_rsi
+
 
 def apply_rsi_strategy(data, rsi_window=14, oversold=30, overbought=70):
     """
@@ -11,6 +12,7 @@ def apply_rsi_strategy(data, rsi_window=14, oversold=30, overbought=70):
 
     Args:
         data        (pd.DataFrame): DataFrame with a 'Close' price column.
+                                    Modified in place.
         rsi_window  (int): Lookback period for RSI calculation (default 14).
         oversold    (int): RSI threshold for a buy signal (default 30).
         overbought  (int): RSI threshold for a sell signal (default 70).
@@ -18,41 +20,26 @@ def apply_rsi_strategy(data, rsi_window=14, oversold=30, overbought=70):
     Returns:
         pd.DataFrame: Original data extended with columns:
             - 'RSI'      : The computed RSI series.
-            - 'Signal'   : 1.0 = hold long, 0.0 = flat.
-            - 'Position' : 1.0 = buy event, -1.0 = sell event, 0.0 = no change.
+            - 'Signal'   : 1 = hold long, 0 = flat (int8).
+            - 'Position' : 1 = buy event, -1 = sell event, 0 = no change (int8).
     """
     if data.empty:
         return data
 
-    df = data.copy()
-
-    # --- RSI Calculation (Wilder / EWM method) ---
-    delta = df['Close'].diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-
-    # Exponential moving average with Wilder's smoothing (com = window - 1)
-    avg_gain = gain.ewm(com=rsi_window - 1, min_periods=rsi_window).mean()
-    avg_loss = loss.ewm(com=rsi_window - 1, min_periods=rsi_window).mean()
+    # Columns are written in place; the caller owns the frame
+    df = data
 
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    df['RSI'] = 100 - (100 / (1 + rs))
+    # --- RSI Calculation (Wilder / EWM method, single fused pass) ---
+    close = df['Close'].to_numpy(dtype=np.float64)
+    df['RSI'] = _wilder_rsi(close, rsi_window)
 
     # --- Signal Generation ---
-    # Carry-forward regime: enter long when RSI < oversold, exit when RSI > overbought
-    df['Signal'] = 0.0
-    in_trade = False
-    for i in range(len(df)):
-        rsi_val = df['RSI'].iloc[i]
-        if pd.isna(rsi_val):
-            continue
-        if not in_trade and rsi_val < oversold:
-            in_trade = True
-        elif in_trade and rsi_val > overbought:
-            in_trade = False
-        df.iloc[i, df.columns.get_loc('Signal')] = 1.0 if in_trade else 0.0
+    # Carry-forward regime: enter long when RSI < oversold, exit when RSI > overbought.
+    # A single compiled scan; rows without an RSI value stay flat.
+    signal = _rsi_regime(df['RSI'].to_numpy(), oversold, overbought)
+    df['Signal'] = signal
 
     # Position = diff of Signal → 1 = buy event, -1 = sell event
-    df['Position'] = df['Signal'].diff()
+    df['Position'] = np.diff(signal, prepend=np.int8(0))
 
     return df
@@ -0,0 +1,18 @@
+"""
+Optional Numba support.
+
+Exposes `njit`, which is Numba's decorator when Numba is installed and a
+no-op otherwise, so kernels still run (as plain Python) without it.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(cache=True)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator